@@ -39,6 +39,52 @@ class CCStorage:
         return self._cc_messages.get(channel, {}).get(control_number, None)
 
 
+class RingBuffer:
+    """A fixed-size single-producer / single-consumer ring buffer. The producer and the consumer
+    each own one index: as long as each side is used from a single thread, no lock is needed."""
+
+    def __init__(self, size: int = 1024):
+        if size <= 0 or size & (size - 1):
+            raise ValueError("Ring buffer size must be a power of two")
+        self._items: list = [None] * size
+        self._mask = size - 1
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    def push(self, item) -> bool:
+        """Push an item in the buffer (producer side).
+
+        Args:
+            item: The item to push.
+
+        Returns:
+            bool: True if the item was pushed, False if the buffer is full.
+        """
+        head = self._head
+        if head - self._tail > self._mask:
+            return False
+        self._items[head & self._mask] = item
+        self._head = head + 1
+        return True
+
+    def pop(self):
+        """Pop the oldest item from the buffer (consumer side).
+
+        Returns:
+            The oldest item, or None if the buffer is empty.
+        """
+        tail = self._tail
+        if tail == self._head:
+            return None
+        index = tail & self._mask
+        item, self._items[index] = self._items[index], None
+        self._tail = tail + 1
+        return item
+
+
 def _clamp_midi(value: int) -> int:
     """Clamp a MIDI value to the range [0, 127]."""
     return max(0, min(127, value))
@@ -130,6 +176,16 @@ class MIDIOut(Subscriber):
             i: {} for i in range(16)
         }  # Track pressed notes per channel
 
+        # Messages sent from the clock thread are handed over to a dedicated output thread. The
+        # buffer is large enough to hold a full all_notes_off burst (16 channels * 128 notes).
+        self._outgoing = RingBuffer(4096)
+        self._latency = 0.0
+        self._outgoing_ready = threading.Event()
+        self._output_loop_shutdown = threading.Event()
+        self._flush, self._flushed = threading.Event(), threading.Event()
+        self._output_loop_thread: Optional[threading.Thread] = None
+        self._setup_output_loop()
+
         self.register_handler("pause", self._pause_handler)
         self.register_handler("stop", self._stop_handler)
         self.register_handler("all_notes_off", lambda _: self.all_notes_off())
@@ -146,16 +202,108 @@ class MIDIOut(Subscriber):
         self.all_notes_off()
         self._nudge = value
 
+    @property
+    def latency(self) -> float:
+        """The output latency in seconds."""
+        return self._latency
+
+    @latency.setter
+    def latency(self, value: float) -> None:
+        """Set the output latency in seconds. Messages emitted by the clock are sent exactly
+        `latency` seconds after the deadline of the event that emitted them, which hides the
+        scheduling jitter of the clock thread as long as it stays below the latency."""
+        if value < 0:
+            raise ValueError("Latency must be positive")
+        self._latency = value
+
     def _pause_handler(self, data: dict) -> None:
         """Handle the pause event."""
         self.all_notes_off()
 
     def _stop_handler(self, data: dict) -> None:
-        """Handle the stop event."""
+        """Handle the stop event. Pending messages are sent before the output thread exits."""
         self.all_notes_off()
+        self._output_loop_shutdown.set()
+        self._flush.set()
+        self._outgoing_ready.set()
+
+    def _setup_output_loop(self) -> None:
+        """Setup the MIDI output loop."""
+
+        def _midi_output_loop():
+            """Send the MIDI messages pushed by the clock thread, in order, at their due time.
+            Simultaneous messages (same due time) are sent as a batch after a single wait. When
+            a flush is requested, pending messages are sent right away without waiting."""
+            micros = self.clock._link.clock().micros
+            flush = self._flush
+            while True:
+                self._outgoing_ready.wait()
+                self._outgoing_ready.clear()
+                batch_time = None
+                while (item := self._outgoing.pop()) is not None:
+                    when, message = item
+                    if when != batch_time and not flush.is_set():
+                        batch_time = when
+                        wait_time = (when - micros()) / 1_000_000
+                        if wait_time > 0:
+                            flush.wait(wait_time)
+                    try:
+                        self._midi_out.send(message)
+                    except Exception as e:
+                        print(f"Error sending MIDI message {message}: {e}")
+                if flush.is_set():
+                    flush.clear()
+                    self._flushed.set()
+                if self._output_loop_shutdown.is_set():
+                    return
+
+        self._output_loop_thread = threading.Thread(target=_midi_output_loop, daemon=True)
+        self._output_loop_thread.start()
+
+    def _send(self, message: mido.Message) -> None:
+        """Send a MIDI message. Messages emitted by the clock thread are pushed to the output
+        thread so that a slow MIDI port never delays the clock. They are sent `latency` seconds
+        after the deadline of the clock event that emitted them. Messages coming from any other
+        thread are sent right away. If the output buffer is full, the clock thread waits for the
+        output thread to make room so that messages are never sent out of order.
+
+        Args:
+            message (mido.Message): The MIDI message to send.
+        """
+        if threading.current_thread() is not self.clock._clock_thread:
+            self._midi_out.send(message)
+            return
+        item = (self.clock.event_time + self._latency * 1_000_000, message)
+        while not self._outgoing.push(item):
+            if not self._output_loop_thread.is_alive():
+                self._midi_out.send(message)
+                return
+            self._outgoing_ready.set()
+            sleep(0.0005)
+        # Only the first message of a batch needs to wake the output thread up
+        if not self._outgoing_ready.is_set():
+            self._outgoing_ready.set()
+
+    def _flush_output(self, timeout: float = 1.0) -> None:
+        """Send the messages waiting in the output buffer right away, and wait until they are
+        sent. This has no effect on the clock thread, whose messages are already sent in order.
+
+        Args:
+            timeout (float): The maximum time to wait for the output thread, in seconds.
+        """
+        if threading.current_thread() is self.clock._clock_thread:
+            return
+        if not self._output_loop_thread.is_alive():
+            return
+        self._flushed.clear()
+        self._flush.set()
+        self._outgoing_ready.set()
+        self._flushed.wait(timeout)
 
     def all_notes_off(self):
-        """Send all notes off message on all channels."""
+        """Send all notes off message on all channels. Pending messages are flushed first, so
+        that no note on message is sent after the note off messages."""
+        self._flush_output()
         for channel in range(16):
             for notes in range(128):
                 self._note_off(note=notes, channel=channel)
@@ -174,7 +322,7 @@ class MIDIOut(Subscriber):
             self._note_off(note=note, channel=channel, velocity=0)
         self.pressed_notes[channel][note] = True
         midi_message = mido.Message("note_on", note=note, velocity=velocity, channel=channel)
-        self._midi_out.send(midi_message)
+        self._send(midi_message)
 
     def _note_off(self, note: int = 60, velocity: int = 0, channel: int = 1) -> None:
         """Send a MIDI note off message.
@@ -186,7 +334,7 @@ class MIDIOut(Subscriber):
         """
         self.pressed_notes[channel][note] = False
         midi_message = mido.Message("note_off", note=note, velocity=velocity, channel=channel)
-        self._midi_out.send(midi_message)
+        self._send(midi_message)
 
     def note(
         self,
@@ -218,7 +366,11 @@ class MIDIOut(Subscriber):
         )
         velocity = velocity
         length = length * self.clock.beat_duration
-        time = self.clock.now - self._nudge
+        # From a clock event (e.g. a Player), start from the deadline of that event
+        if threading.current_thread() is self.clock._clock_thread:
+            time = self.clock.event_beat - self._nudge
+        else:
+            time = self.clock.now - self._nudge
 
         if timestamp is None:
             self.clock.add(
@@ -255,15 +407,15 @@ class MIDIOut(Subscriber):
 
     def tick(self, *args, **kwargs):
         """Send a MIDI clock message."""
-        self._midi_out.send(mido.Message("clock"))
+        self._send(mido.Message("clock"))
 
     def start(self, *args, **kwargs):
         """Send a MIDI start message."""
-        self._midi_out.send(mido.Message("start"))
+        self._send(mido.Message("start"))
 
     def stop(self, *args, **kwargs):
         """Send a MIDI stop message."""
-        self._midi_out.send(mido.Message("stop"))
+        self._send(mido.Message("stop"))
 
     def pitch_bend(self, value: int = 0, channel: int = 1, **kwargs) -> None:
         """Send a MIDI pitch bend message.
@@ -273,7 +425,7 @@ class MIDIOut(Subscriber):
             channel (int): The MIDI channel.
         """
         pb = mido.Message("pitchwheel", pitch=value, channel=channel)
-        self._midi_out.send(pb)
+        self._send(pb)
 
     def control_change(
         self,
@@ -293,13 +445,13 @@ class MIDIOut(Subscriber):
         cc = mido.Message("control_change", control=control, value=value, channel=channel - 1)
         if timestamp is not None:
             self.clock.add_from_timestamp(
-                func=lambda: self._midi_out.send(cc),
+                func=lambda: self._send(cc),
                 timestamp=timestamp + self._nudge,
                 once=True,
                 name=f"cc_{self.port}_{timestamp}",
             )
         else:
-            self._midi_out.send(cc)
+            self._send(cc)
 
     def program_change(
         self, program: int = 0, channel: int = 1, timestamp: Optional[int] = None, **kwargs
@@ -313,13 +465,13 @@ class MIDIOut(Subscriber):
         pc = mido.Message("program_change", program=program, channel=channel - 1)
         if timestamp is not None:
             self.clock.add_from_timestamp(
-                func=lambda: self._midi_out.send(pc),
+                func=lambda: self._send(pc),
                 timestamp=timestamp + self._nudge,
                 once=True,
                 name=f"pc_{self.port}_{timestamp}",
             )
         else:
-            self._midi_out.send(pc)
+            self._send(pc)
 
     def sysex(self, data: list, timestamp: Optional[int] = None, *kwargs) -> None:
         """Send a MIDI system exclusive message.
@@ -330,13 +482,13 @@ class MIDIOut(Subscriber):
         sysex = mido.Message("sysex", data=data)
         if timestamp is not None:
             self.clock.add_from_timestamp(
-                func=lambda: self._midi_out.send(sysex),
+                func=lambda: self._send(sysex),
                 timestamp=timestamp + self._nudge,
                 once=True,
                 name=f"sysex_{self.port}_{timestamp}",
             )
         else:
-            self._midi_out.send(sysex)
+            self._send(sysex)
 
     def make_instrument(self, channel: int, control_map: dict[str, int]):
         """
@@ -1,21 +1,24 @@
 from ...environment import Subscriber
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TypeVar, Callable, ParamSpec, Optional, Dict, Self, Any, List
 from ...Time.Clock import Clock, TimePos
-from types import LambdaType, GeneratorType
+from types import GeneratorType
 from inspect import isgeneratorfunction
 from .Pattern import Pattern
 from .Rest import Rest
-from .Library.TimePattern import TimePattern
 from dataclasses import dataclass
 import traceback
 from inspect import isgeneratorfunction, isgenerator
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from operator import is_
 import logging
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# Maximum number of successive calls (patterns, callables, generators) used to resolve a value
+_MAX_RESOLUTION_DEPTH = 64
+
 
 @dataclass
 class Sender:
@@ -29,6 +32,7 @@ class Sender:
     manual_polyphony: bool = False
     iterations: int = 0
     limit: Optional[int] = None
+    _plan: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
 class Player(Subscriber):
@@ -125,66 +129,158 @@ class Player(Subscriber):
 
     # Argument and keyword argument resolvers
 
-    def _args_resolver(self, args: tuple[Any]) -> tuple[Any]:
-        """Resolve pattern arguments. Each pattern is submitted along with *args and **kwargs.
-        These arguments can be of many different types, including Patterns, Callables, and plain
-        values. This method resolves the arguments recursively in order to feed a valid argument
-        to the PlayerPattern send_method.
+    def _resolver(self, pattern: Sender) -> Callable[[int], tuple[tuple, dict]]:
+        """Return the argument resolver of a pattern, compiling it on first use. The shape of the
+        arguments of a pattern never changes between iterations: the resolver is generated once
+        and cached on the pattern itself. It is rebuilt if the pattern args are replaced or if the
+        pattern kwargs are modified (even in place), which is checked by comparing the kwargs keys
+        and value identities with the ones the resolver was compiled for.
 
         Args:
-            args (tuple): The arguments
+            pattern (Sender): The pattern
 
         Returns:
-            tuple: The resolved arguments
+            Callable: A function taking the pattern index and returning the resolved args and kwargs
         """
-        new_args = ()
+        args, keys, values = pattern.args, tuple(pattern.kwargs), tuple(pattern.kwargs.values())
+        plan = pattern._plan
+        if (
+            plan is None
+            or plan[0] is not args
+            or plan[1] != keys
+            or not all(map(is_, plan[2], values))
+        ):
+            resolver = self._compile_resolver(*self._resolution_plan(pattern))
+            plan = pattern._plan = (args, keys, values, resolver)
+        return plan[3]
+
+    def _resolution_plan(self, pattern: Sender) -> tuple[list, list]:
+        """Classify each argument of a pattern ("pattern", "callable", "next", "nested" or "const")
+        so that its type does not have to be inspected again each time the pattern is played.
 
-        for arg in args:
+        Args:
+            pattern (Sender): The pattern to plan for
+
+        Returns:
+            tuple: The args plan and the kwargs plan
+        """
+        args_plan = []
+        for arg in pattern.args:
             if isinstance(arg, Pattern):
-                new_args += (arg(self.iterator - self._silence_count),)
-            elif isinstance(arg, Callable | LambdaType):
-                new_args += (arg(),)
-            elif isinstance(arg, TimePattern):
-                new_args += (arg(self._clock.now),)
+                args_plan.append(("pattern", arg))
+            elif callable(arg):
+                args_plan.append(("callable", arg))
             elif isinstance(arg, (list, tuple)):
-                new_args += (arg,)
+                args_plan.append(("const", arg))
             elif self.__is_generator_or_iterable(arg):
-                new_args += (next(arg),)
+                args_plan.append(("next", arg))
+
+        kwargs_plan = []
+        for key, value in pattern.kwargs.items():
+            if isinstance(value, Pattern):
+                kind = "pattern"
+            elif isinstance(value, (list, tuple, dict)):
+                kind = "nested"
+            elif self.__is_generator_or_iterable(value):
+                kind = "next"
+            elif callable(value):
+                kind = "callable"
+            else:
+                kind = "const"
+            kwargs_plan.append((key, kind, value))
+
+        return args_plan, kwargs_plan
 
-        return new_args  # type: ignore
+    def _compile_resolver(
+        self, args_plan: list[tuple[str, Any]], kwargs_plan: list[tuple[str, str, Any]]
+    ) -> Callable[[int], tuple[tuple, dict]]:
+        """Generate a function resolving pattern arguments following a resolution plan. Each
+        pattern is submitted along with *args and **kwargs. These arguments can be of many different
+        types, including Patterns, Callables, and plain values. The generated function resolves
+        all of them in straight-line code (no loop, no type check) to feed valid arguments to the
+        PlayerPattern send_method. Plain keyword values are passed through as is, other keyword
+        values are resolved recursively to ensure they are fully resolved.
 
-    def _kwargs_resolver(self, kwargs: dict[str, Any]) -> dict[str, Any]:
-        """Resolve pattern keyword arguments. This method is recursive and can handle nested patterns.
-        Each pattern is submitted along with *args and **kwargs. These arguments can be of many different
-        types, including Patterns, Callables, and plain values. This method resolves the keyword arguments
-        recursively to ensure all values are fully resolved.
+        For instance, `Pseq(1, 2), vel=lambda: 100, dur=1` compiles to:
+
+            def resolver(index):
+                return (a0(index), ), {'vel': resolve_value(k0, index), 'dur': k1}
 
         Args:
-            kwargs (dict): The keyword arguments of the pattern.
+            args_plan (list): The arguments resolution plan
+            kwargs_plan (list): The keyword arguments resolution plan
 
         Returns:
-            dict: The fully resolved keyword arguments
+            Callable: A function taking the pattern index and returning the resolved args and kwargs
         """
+        namespace = {"resolve_value": self._resolve_value}
+
+        args_source = []
+        for position, (kind, value) in enumerate(args_plan):
+            name = f"a{position}"
+            namespace[name] = value
+            if kind == "pattern":
+                args_source.append(f"{name}(index), ")
+            elif kind == "callable":
+                args_source.append(f"{name}(), ")
+            elif kind == "next":
+                args_source.append(f"next({name}), ")
+            else:
+                args_source.append(f"{name}, ")
+
+        kwargs_source = []
+        for position, (key, kind, value) in enumerate(kwargs_plan):
+            name = f"k{position}"
+            namespace[name] = value
+            if kind == "const":
+                kwargs_source.append(f"{key!r}: {name}")
+            elif kind == "pattern":
+                kwargs_source.append(f"{key!r}: resolve_value({name}(index), index)")
+            else:
+                kwargs_source.append(f"{key!r}: resolve_value({name}, index)")
 
-        def resolve_value(value: Any) -> Any:
-            """Resolve a value recursively."""
-            if isinstance(value, Pattern):
-                return resolve_value(value(self.iterator - self._silence_count))
+        source = (
+            "def resolver(index):\n"
+            f"    return ({''.join(args_source)}), {{{', '.join(kwargs_source)}}}\n"
+        )
+        exec(compile(source, "<pattern resolver>", "exec"), namespace)
+        return namespace["resolver"]
+
+    @staticmethod
+    def _resolve_value(value: Any, index: int) -> Any:
+        """Resolve a keyword argument value. Patterns, callables and generators are resolved
+        iteratively until a plain value is reached, containers are resolved item by item.
+
+        Args:
+            value (Any): The value to resolve
+            index (int): The current pattern index
+
+        Returns:
+            Any: The fully resolved value
+
+        Raises:
+            ValueError: If the value cannot be resolved in `_MAX_RESOLUTION_DEPTH` steps (e.g. a
+                callable returning itself)
+        """
+        for _ in range(_MAX_RESOLUTION_DEPTH):
+            if type(value) in (int, float):
+                return value
+            elif isinstance(value, Pattern):
+                value = value(index)
             elif isinstance(value, (list, tuple)):
-                return [resolve_value(item) for item in value]
+                return [Player._resolve_value(item, index) for item in value]
             elif isinstance(value, dict):
-                return {k: resolve_value(v) for k, v in value.items()}
-            elif self.__is_generator_or_iterable(value):
-                return resolve_value(next(value))
-            elif isinstance(value, Callable | LambdaType):
+                return {k: Player._resolve_value(v, index) for k, v in value.items()}
+            elif Player.__is_generator_or_iterable(value):
+                value = next(value)
+            elif callable(value):
                 try:
-                    return resolve_value(value())
+                    value = value()
                 except TypeError:
-                    return resolve_value(value(self.iterator - self._silence_count))
+                    value = value(index)
             else:
                 return value
-
-        return {key: resolve_value(value) for key, value in kwargs.items()}
+        raise ValueError(f"Could not resolve {value!r} in {_MAX_RESOLUTION_DEPTH} steps")
 
     def stop(self, _: dict = {}):
         """Method to stop a player.
@@ -255,7 +351,7 @@ class Player(Subscriber):
 
         if self._name in self._clock._events:
             if quant:
-                self._clock._events[self._name].next_time = int(self._clock.now) + quant
+                self._clock.reschedule(self._name, int(self._clock.now) + quant)
                 _callback(reset_iterator=True)
             else:
                 _callback()
@@ -301,8 +397,7 @@ class Player(Subscriber):
         Returns:
             None
         """
-        args = self._args_resolver(pattern.args)
-        kwargs = self._kwargs_resolver(pattern.kwargs)
+        args, kwargs = self._resolver(pattern)(self._iterator - self._silence_count)
         self._speed = kwargs.get("speed", 1)
         end = kwargs.get("end", False)
         if end:
@@ -352,72 +447,60 @@ class Player(Subscriber):
         very complex and handles a lot of different cases.
 
         Args:
-            again (bool): Whether the pattern is playing _again_ or not.
+            first_time (bool): Whether the pattern is pushed for the first time or not.
 
         Returns:
             None
         """
+        pattern = self.current_pattern
+        pattern_kwargs = pattern.kwargs
+
         # These are kwargs link to time that we should handle and process manually!
-        kwargs = {
-            "period": lambda: self.current_pattern.kwargs.get("period", 1),
-            "nudge": self.current_pattern.kwargs.get("nudge", 0),
-            "swing": self.current_pattern.kwargs.get("swing", 0),
-        }
-
-        self._resolve_period(kwargs)
-        schedule_silence = self._process_silence(kwargs)
-        self._handle_swing(schedule_silence, kwargs)
-        self.current_pattern.limit = self.current_pattern.kwargs.get("limit", None)
-        kwargs["time"] = kwargs["period"] * self._speed
-
-        self._iterator, self.current_pattern.iterations = (
-            self._iterator + 1,
-            self.current_pattern.iterations + 1,
-        )
+        period = pattern_kwargs.get("period", 1)
+        if type(period) not in (int, float):
+            period = self._resolve_period(period)
+        schedule_silence = isinstance(period, Rest)
+        if schedule_silence:
+            period = self._process_silence(period)
+        swing = pattern_kwargs.get("swing", 0)
+        if swing > 0:
+            period = self._handle_swing(period, swing)
+        pattern.limit = pattern_kwargs.get("limit", None)
+
+        self._iterator += 1
+        pattern.iterations += 1
 
         if first_time:
-            player_last_deadline = self._clock._events[self._name].next_time - kwargs["period"]
+            player_last_deadline = self._clock._events[self._name].next_time - period
         else:
             player_last_deadline = self._clock._events[self._name].next_time
         logging.info(f"Player {self._name} last deadline: {player_last_deadline}")
         self._clock.add(
             name=self._name,
-            func=self._func if not schedule_silence else self._silence,
+            func=self._silence if schedule_silence else self._func,
+            time=period * self._speed,
             time_reference=player_last_deadline,
-            pattern=self.current_pattern,
-            **kwargs,
+            nudge=pattern_kwargs.get("nudge", 0),
+            pattern=pattern,
         )
 
-    def _resolve_period(self, kwargs):
+    def _resolve_period(self, period: Any) -> Any:
         """Resolve the period argument."""
-        while isinstance(kwargs["period"], Callable | LambdaType | Pattern):
-            if isinstance(kwargs["period"], Pattern):
-                kwargs["period"] = kwargs["period"](self.iterator)
-            elif isinstance(kwargs["period"], Callable | LambdaType):
-                kwargs["period"] = kwargs["period"]()
+        while callable(period):
+            period = period(self.iterator) if isinstance(period, Pattern) else period()
+        return period
 
-    def _process_silence(self, kwargs):
+    def _process_silence(self, period: Rest) -> int | float:
         """Process silence in the pattern."""
-        schedule_silence = False
-        if isinstance(kwargs["period"], Rest):
-            kwargs["period"] = kwargs["period"].duration
-            self._silence_count += 1
-            schedule_silence = True
-        return schedule_silence
-
-    def _handle_swing(self, schedule_silence, kwargs):
-        """Handle swing in the pattern."""
-        swing = kwargs.get("swing", 0.0)
-        if swing > 0:
-            if self._iterator % 2 == 0:
-                adjusted_duration = kwargs["period"] * (1 - swing)
-            else:
-                adjusted_duration = kwargs["period"] * (1 + swing)
+        self._silence_count += 1
+        return period.duration
 
-            if schedule_silence:
-                kwargs["period"] = Rest(adjusted_duration)
-            else:
-                kwargs["period"] = adjusted_duration
+    def _handle_swing(self, period: int | float, swing: int | float) -> int | float:
+        """Handle swing in the pattern."""
+        if self._iterator % 2 == 0:
+            return period * (1 - swing)
+        else:
+            return period * (1 + swing)
 
     def _transition_to_next_pattern(self):
         """
@@ -434,10 +517,10 @@ class Player(Subscriber):
 
         # Ensure the next pattern starts immediately after the current pattern's duration
         next_pattern_delay = self.current_pattern.kwargs.get("period", 1)
-        if isinstance(next_pattern_delay, Callable | LambdaType | Pattern):
+        if callable(next_pattern_delay):
             if isinstance(next_pattern_delay, Pattern):
                 next_pattern_delay = next_pattern_delay(self.iterator)
-            elif isinstance(next_pattern_delay, Callable | LambdaType):
+            else:
                 next_pattern_delay = next_pattern_delay()
 
         # Adding the next pattern start immediately after the current one
@@ -478,27 +561,22 @@ class Player(Subscriber):
         return Player(name=name, clock=clock)
 
     @classmethod
-    def initialize_patterns(cls, clock: Clock) -> Dict[str, Self]:
+    def initialize_patterns(cls, clock: Clock) -> Mapping[str, Self]:
         """Initialize Player objects in bulk for the user to use. This function is called
         during the initialization of the PlayerSystem. The player objects are then distributed
         to the globals() dictionary so that they can be accessed directly by the user.
 
+        Players are created lazily: a Player object is only instantiated (and subscribed to the
+        clock environment) the first time it is looked up in the returned mapping.
+
         Args:
             clock (Clock): The clock object.
 
         Returns:
-            Dict[str, Self]: A dictionary of Player objects.
+            Mapping[str, Self]: A mapping of Player objects, indexed by name.
         """
-        patterns = {}
-        for i in range(20):
-            name = f"p{i}"
-            player = Player(name=name, clock=clock)
-            patterns[name] = player
-        for i in range(20):
-            name = f"P{i}"
-            player = Player(name=name, clock=clock)
-            patterns[name] = player
-        return patterns
+        names = [f"p{i}" for i in range(20)] + [f"P{i}" for i in range(20)]
+        return _LazyPlayers(clock=clock, names=names)
 
     @staticmethod
     def _play_factory(send_method: Callable[P, T], *args, **kwargs) -> Sender:
@@ -525,10 +603,38 @@ class Player(Subscriber):
     @staticmethod
     def __is_generator_or_iterable(arg: Any) -> bool:
         """Check if the argument is a generator or an iterable."""
-        tests = [
-            isgeneratorfunction(arg),
-            isgenerator(arg),
-            isinstance(arg, GeneratorType),
-            isinstance(arg, Iterable),
-        ]
-        return any(tests)
+        return (
+            isgeneratorfunction(arg)
+            or isgenerator(arg)
+            or isinstance(arg, GeneratorType)
+            or isinstance(arg, Iterable)
+        )
+
+
+class _LazyPlayers(Mapping):
+    """Mapping of Player objects instantiating each player on first access. Iterating over the
+    values or the items of the mapping instantiates all the players."""
+
+    def __init__(self, clock: Clock, names: Iterable[str]):
+        self._clock = clock
+        self._names = dict.fromkeys(names)
+        self._players: Dict[str, Player] = {}
+
+    def __getitem__(self, name: str) -> Player:
+        player = self._players.get(name)
+        if player is None:
+            if name not in self._names:
+                raise KeyError(name)
+            player = self._players[name] = Player(name=name, clock=self._clock)
+            if self._clock.env is not None:
+                self._clock.env.subscribe(player)
+        return player
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
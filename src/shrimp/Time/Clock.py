@@ -1,6 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import logging
-import uuid
 import traceback
 from ..utils import info_message
 from ..environment import Subscriber, Environment
@@ -9,24 +8,27 @@ from typing import Any, Callable, Dict, Optional
 import types
 import threading
 import time as time_module
+import itertools
+import heapq
 import math
 import link
-import types
 
 
-@dataclass(order=True)
+@dataclass(slots=True)
 class PriorityEvent:
-    """A class to represent an event to be scheduled."""
+    """A class to represent an event to be scheduled. Events are ordered on the clock heap
+    through `(next_time + nudge, seq, name)` tuples and are never compared to each other."""
 
     name: str
-    next_time: int | float = field(compare=True)
-    start_time: int | float = field(compare=False)
-    nudge: int | float = field(compare=False)
-    item: Any = field(compare=False)
+    next_time: int | float
+    start_time: int | float
+    nudge: int | float
+    item: Any
     has_played: bool = False
     passthrough: bool = False
     persistant: bool = False
     once: bool = False
+    seq: int = 0
 
 
 class Clock(Subscriber):
@@ -43,6 +45,10 @@ class Clock(Subscriber):
         self._carousel_clock_callback: Optional[Callable] = lambda a, b, c, d: 0.1
         self._stop_event: threading.Event = threading.Event()
         self._events: Dict[str, PriorityEvent] = {}
+        self._queue: list[tuple[int | float, int, str]] = []
+        self._queue_counter = itertools.count()
+        self._queue_lock = threading.Lock()
+        self._anonymous_counter = itertools.count()
         self._playing: bool = True
         self._link = link.Link(tempo)
         self._link_epoch = self._link.clock().micros()
@@ -50,10 +56,15 @@ class Clock(Subscriber):
         self._link.enabled = True
         self._link.startStopSyncEnabled = True
         self._internal_time = 0.0
+        self._event_time, self._event_beat = 0.0, 0.0
         self._beat, self._bar, self._phase = 0, 0, 0
+        self._tempo = tempo
         self._nominator, self._denominator = 4, 4
         self._grain = grain
         self._delay = delay
+        # Duration (in seconds) between two captures of the Link session state
+        self._capture_interval = 0.01
+        self._recapture = False
         self.register_handler("start", self._start)
         self.register_handler("play", self.play)
         self.register_handler("pause", self.pause)
@@ -103,6 +114,19 @@ class Clock(Subscriber):
         microsecond_delay = self._delay * 10000
         self._internal_time = value - microsecond_delay
 
+    @property
+    def event_time(self) -> int | float:
+        """Return the Link time (in microseconds) at which the event being executed was due.
+        Executing an event always happens slightly after its deadline: this value can be used
+        by outputs to compensate for the scheduling jitter."""
+        return self._event_time
+
+    @property
+    def event_beat(self) -> int | float:
+        """Return the beat at which the event being executed was due. Events scheduled relative
+        to this beat (instead of `now`) do not inherit the lateness of the current event."""
+        return self._event_beat
+
     @property
     def children(self):
         """Return the children of the clock"""
@@ -151,6 +175,9 @@ class Clock(Subscriber):
             session = self._link.captureSessionState()
             session.setTempo(value, self._link.clock().micros())
             self._link.commitSessionState(session)
+            self._tempo = value
+            # Extrapolating from the last capture with the new tempo would move the beat
+            self._recapture = True
 
     @property
     def bar(self) -> int | float:
@@ -208,8 +235,9 @@ class Clock(Subscriber):
 
     def _reset_children_times(self) -> None:
         self.env.dispatch(self, "children_reset", {})
-        for child in self._events.values():
+        for child in list(self._events.values()):
             child.next_time = 0
+        self._rebuild_queue()
 
     def play(self) -> None:
         """Play the clock: start the clock and update the session state to request play.
@@ -222,6 +250,7 @@ class Clock(Subscriber):
         session.requestBeatAtTime(0, self._link.clock().micros(), self._denominator)
         session.setIsPlaying(True, self._link.clock().micros())
         self._link.commitSessionState(session)
+        self._recapture = True
         self._reset_children_times()
 
     def pause(self) -> None:
@@ -238,24 +267,30 @@ class Clock(Subscriber):
         session = self._link.captureSessionState()
         session.setIsPlaying(False, self._link.clock().micros())
         self._link.commitSessionState(session)
+        self._recapture = True
         if self.env:
             self.env.dispatch(self, "pause", {})
 
-    def precise_wait(self, duration) -> None:
+    def precise_wait(self, duration) -> bool:
         """
-        Wait for a specified duration using a combination of sleep and busy-waiting.
+        Wait for a specified duration using a combination of sleep and busy-waiting. The sleep
+        waits on the stop event, so that stopping the clock interrupts it.
 
         Args:
             duration (float): The duration to wait in seconds.
+
+        Returns:
+            bool: True if the clock was stopped while waiting.
         """
         end_time = time_module.perf_counter() + duration
         # Sleep until 1000 microseconds before target
         sleep_duration = duration - 0.001
-        if sleep_duration > 0:
-            time_module.sleep(sleep_duration)
+        if sleep_duration > 0 and self._stop_event.wait(sleep_duration):
+            return True
         while time_module.perf_counter() < end_time:
             # Busy-wait for the remaining time
             pass
+        return False
 
     def _stop(self, _: dict = {}) -> None:
         """Stop the clock and wait for the thread to finish
@@ -268,25 +303,6 @@ class Clock(Subscriber):
             self.env.dispatch(self, "stop", {})
         self._clock_thread.join()
 
-    def _update_time(self):
-        """
-        Utility function to capture timing information from Link Session.
-
-        Returns:
-            bool: True if time has been successfully captured, False otherwise.
-        """
-        link_state = self._link.captureSessionState()
-        self.internal_time = self._link.clock().micros()
-        self._playing = link_state.isPlaying()
-        self._beat, self._phase, self._tempo = (
-            link_state.beatAtTime(self.internal_time, self._denominator),
-            link_state.phaseAtTime(self.internal_time, self._denominator),
-            link_state.tempo(),
-        )
-        self._bar = self._beat // self._denominator
-        if not self._playing:
-            self.pause()
-
     def _run_carousel(self):
 
         ticks, start = 0, self._link.clock().micros()
@@ -295,36 +311,89 @@ class Clock(Subscriber):
             session, now = (self._link.captureSessionState(), self._link.clock().micros())
             if self.beat >= 0:
                 wait_time = self._carousel_clock_callback(start, ticks, session, now)
-                if wait_time > 0:
-                    self.precise_wait(wait_time)
+                if wait_time > 0 and self.precise_wait(wait_time):
+                    break
                 ticks += 1
 
     def run(self) -> None:
         """Clock mechanism entry point. This method is called when the clock thread is started.
         It periodically updates the internal time representation and executes due functions.
-        This function busy loops in its own thread (!!)."""
-
-        while not self._stop_event.is_set():
-            start_time = time_module.perf_counter()
-            self._update_time()
-            self._execute_due_functions()
-            end_time = time_module.perf_counter()
-            elapsed_time = end_time - start_time
-            wait_time = max(0, self._grain - elapsed_time)
-
+        This function loops in its own thread until the clock is stopped.
+
+        Timing information is captured from the Link session every `_capture_interval` seconds,
+        and right away when the tempo or the play state is changed from this process. In between,
+        the beat and phase are extrapolated from the last capture using the captured tempo, which
+        avoids allocating a new session state on every iteration. Methods used in
+        the loop are bound to local variables beforehand, and due functions are only looked up
+        when the top of the scheduling heap is due.
+
+        Between two iterations, the thread waits for the grain duration or until the deadline of
+        the next scheduled event, whichever comes first (the full grain when paused). Waiting on
+        the stop event allows `stop` to wake the thread up immediately."""
+        capture = self._link.captureSessionState
+        micros = self._link.clock().micros
+        stop_is_set = self._stop_event.is_set
+        wait = self._stop_event.wait
+        execute_due_functions = self._execute_due_functions
+        perf_counter = time_module.perf_counter
+        capture_interval = self._capture_interval * 1_000_000
+        last_capture, last_beat, last_phase = -math.inf, 0, 0
+
+        while True:
+            start_time = perf_counter()
+            denominator = self._denominator
+            now = micros() - self._delay * 10000
+            if self._recapture or now - last_capture >= capture_interval:
+                self._recapture = False
+                state = capture()
+                beat = state.beatAtTime(now, denominator)
+                self._phase = state.phaseAtTime(now, denominator)
+                self._tempo = state.tempo()
+                self._playing = state.isPlaying()
+                last_capture, last_beat, last_phase = now, beat, self._phase
+                if not self._playing:
+                    self.pause()
+            else:
+                elapsed_beats = (now - last_capture) * self._tempo / 60_000_000
+                beat = last_beat + elapsed_beats
+                self._phase = (last_phase + elapsed_beats) % denominator
+            if int(beat) != int(self._beat):
+                self._bar = beat // denominator
+            self._internal_time, self._beat = now, beat
+
+            queue = self._queue
+            if queue and queue[0][0] <= beat:
+                execute_due_functions()
+            wait_time = self._grain
+            # Deferred events (clock paused, or scheduled by a callback) are still due and stay at
+            # the top of the heap: waiting for their (past) deadline would spin the loop, wait for
+            # a full grain instead
+            if self._queue:
+                deadline = (self._queue[0][0] - beat) * 60 / self._tempo
+                if deadline > 0:
+                    wait_time = min(wait_time, deadline)
+            wait_time -= perf_counter() - start_time
             if wait_time > 0:
-                self.precise_wait(wait_time)
+                if wait(wait_time):
+                    break
+            elif stop_is_set():
+                break
 
     def _execute_due_functions(self) -> None:
         """Execute all functions that are due to be executed.
 
-        This method iterates over the possible callables and executes them if they are due to be executed.
-        A callable is considered due if its `next_time` attribute is less than or equal to the current beat
-        and it has not been played before.
+        Events are stored in a min-heap of `(next_time + nudge, seq, name)` entries. Entries are
+        popped from the top of the heap as long as they are due (their deadline is less than or
+        equal to the current beat). Rescheduling or removing an event does not touch the heap:
+        outdated entries are left behind and simply skipped when popped (their `seq` no longer
+        matches the one of the event currently registered under that name).
 
         If the clock is playing or the callable has the `passthrough` attribute set to True, the callable
         is played and marked as played. If the callable has the `once` attribute set to True, it is removed
-        from the list of children after being played.
+        from the list of children after being played. Due events that cannot be played yet (clock paused)
+        are pushed back on the heap. So are events scheduled while this method is running (e.g. an
+        event rescheduling itself with no delay): they are played on the next clock iteration, which
+        lets the clock move forward in between.
 
         If an exception occurs during the execution of a callable, an error message is printed along with
         the traceback.
@@ -332,24 +401,76 @@ class Clock(Subscriber):
         Returns:
             None
         """
-        possible_callables = sorted(self._events.values(), key=lambda event: event.next_time)
-        for callable in possible_callables:
-            adjusted_time = callable.next_time + callable.nudge
-            if adjusted_time <= self._beat and not callable.has_played:
-                if self._playing or callable.passthrough:
-                    callable.has_played = True
-                    try:
-                        func, args, kwargs = callable.item
-                        func(*args, **kwargs)
-                        if callable.once:
-                            del self._events[callable.name]
-                    except Exception as e:
-                        info_message(
-                            f"Error in function [red]{func.__name__}[/red]: [yellow]{e}[/yellow]",
-                            should_print=True,
-                        )
-                        print(traceback.format_exc())
-                        pass
+        queue, events, deferred = self._queue, self._events, []
+        last_seq = next(self._queue_counter)
+        while queue and queue[0][0] <= self._beat:
+            entry = heapq.heappop(queue)
+            deadline, seq, name = entry
+            callable = events.get(name)
+            if callable is None or callable.seq != seq or callable.has_played:
+                continue
+            if seq > last_seq or not (self._playing or callable.passthrough):
+                deferred.append(entry)
+                continue
+            callable.has_played = True
+            self._event_beat = deadline
+            self._event_time = (
+                self._internal_time
+                + self._delay * 10000
+                + (deadline - self._beat) * 60_000_000 / self._tempo
+            )
+            try:
+                func, args, kwargs = callable.item
+                func(*args, **kwargs)
+                if callable.once:
+                    events.pop(name, None)
+            except Exception as e:
+                info_message(
+                    f"Error in function [red]{func.__name__}[/red]: [yellow]{e}[/yellow]",
+                    should_print=True,
+                )
+                print(traceback.format_exc())
+        if deferred:
+            with self._queue_lock:
+                for entry in deferred:
+                    heapq.heappush(self._queue, entry)
+        if len(queue) > 2 * len(events) + 64:
+            self._rebuild_queue()
+
+    def _schedule(self, event: PriorityEvent) -> None:
+        """Push an event on the scheduling heap. Older heap entries for the same event become stale.
+
+        Args:
+            event (PriorityEvent): The event to schedule.
+        """
+        with self._queue_lock:
+            event.seq = next(self._queue_counter)
+            heapq.heappush(self._queue, (event.next_time + event.nudge, event.seq, event.name))
+
+    def _rebuild_queue(self) -> None:
+        """Rebuild the scheduling heap from the registered events, dropping stale entries.
+        The heap may be rebuilt while another thread schedules events: both operations hold the
+        queue lock so that no entry is pushed on a heap that is about to be replaced."""
+        with self._queue_lock:
+            queue = [
+                (event.next_time + event.nudge, event.seq, name)
+                for name, event in list(self._events.items())
+                if not event.has_played
+            ]
+            heapq.heapify(queue)
+            self._queue = queue
+
+    def reschedule(self, name: str, time: int | float) -> None:
+        """Move an event already scheduled on the clock to a new time.
+
+        Args:
+            name (str): The name of the event.
+            time (int | float): The new time at which the event should be executed.
+        """
+        event = self._events.get(name)
+        if event is not None:
+            event.next_time = time
+            self._schedule(event)
 
     def beats_until_next_bar(self, as_int: bool = True) -> int | float:
         """Return the number of beats until the next bar."""
@@ -468,6 +589,7 @@ class Clock(Subscriber):
         children.passthrough = passthrough
         children.once = once
         children.nudge = nudge
+        self._schedule(children)
         return children
 
     def _add_to_scheduler(
@@ -514,6 +636,7 @@ class Clock(Subscriber):
             has_played=False,
             item=(func, args, kwargs),
         )
+        self._schedule(children)
         return children
 
     def generate_event_name(self, func: Callable, name: Optional[str] = None) -> str:
@@ -525,39 +648,37 @@ class Clock(Subscriber):
         Returns:
             str: The generated name.
         """
-        not_a_lambda = isinstance(func, Callable) and func.__name__ != "<lambda>"
-        func_name = name if name else func.__name__ if not_a_lambda else str(uuid.uuid1())[:8]
-        return func_name
+        if name:
+            return name
+        not_a_lambda = callable(func) and func.__name__ != "<lambda>"
+        return func.__name__ if not_a_lambda else f"anonymous_{next(self._anonymous_counter)}"
 
     def clear(self) -> None:
         """Clear all events currently scheduled."""
         if self.env:
             self.env.dispatch(self, "all_notes_off", {})
         # Clear all events except those who are persistant
-        self._events = {k: v for k, v in self._events.items() if v.persistant}
+        self._events = {k: v for k, v in list(self._events.items()) if v.persistant}
+        self._rebuild_queue()
 
     def remove(self, *args) -> None:
         """Remove an event from the clock."""
-        args = filter(lambda x: isinstance(x, types.FunctionType | types.LambdaType), args)
         for func in args:
-            if func.__name__ in self._events:
-                del self._events[func.__name__]
+            if type(func) is types.FunctionType:
+                self._events.pop(func.__name__, None)
 
     def remove_by_func(self, *args) -> None:
         """Remove an event from the clock from its func."""
-        args = filter(lambda x: isinstance(x, types.FunctionType | types.LambdaType), args)
-        to_remove = []
-        for func in args:
-            for name, event in self._events.items():
-                if event.item[0] == func:
-                    to_remove.append(name)
-        for name in to_remove:
-            del self._events[name]
+        funcs = [func for func in args if type(func) is types.FunctionType]
+        if not funcs:
+            return
+        for name, event in list(self._events.items()):
+            if event.item[0] in funcs:
+                self._events.pop(name, None)
 
     def remove_by_name(self, name: str) -> None:
         """Remove an event from the clock by its event name."""
-        if name in self._events:
-            del self._events[name]
+        self._events.pop(name, None)
 
     def time_position(self):
         """Return the time position of the clock."""
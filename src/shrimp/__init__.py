@@ -40,10 +40,6 @@ clock = Clock(
     delay=int(CONFIGURATION["clock"]["delay"]),
 )
 env.add_clock(clock)
-# pattern = Player.initialize_patterns(clock)
-# for pattern in pattern.values():
-#     # Registering the pattern to the global environment
-#     env.subscribe(pattern)
 
 # Opening MIDI output ports based on user configuration
 for all_output_midi_ports in CONFIGURATION["midi"]["out_ports"]:
@@ -190,10 +186,9 @@ clock._start()
 #             return Player._play_factory(kabel, *args, **kwargs)
 
 
-# # Adding all patterns to the global scope
+# # Adding all patterns to the global scope (each player subscribes to the environment of the
+# # clock when it is first accessed)
 # patterns = Player.initialize_patterns(clock)
-# for pattern in patterns.values():
-#     env.subscribe(pattern)
 # for key, value in patterns.items():
 #     globals()[key] = value
 
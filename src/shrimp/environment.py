@@ -1,4 +1,6 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, Optional, TYPE_CHECKING
+from collections import defaultdict
+from bisect import bisect_left
 
 if TYPE_CHECKING:
     from .Time.Clock import Clock
@@ -9,6 +11,8 @@ class Environment:
 
     def __init__(self):
         self._subscribers = []
+        self._handlers: Dict[str, list["Subscriber"]] = defaultdict(list)
+        self._positions: Dict[int, int] = {}
         self._clock: Optional["Clock"] = None
 
     @property
@@ -38,20 +42,39 @@ class Environment:
             subscriber: The component to subscribe to the global environment
 
         """
+        self._positions.setdefault(id(subscriber), len(self._subscribers))
         self._subscribers.append(subscriber)
         subscriber.env = self
+        for message_type in subscriber.message_handlers:
+            self._index_handler(subscriber, message_type)
+
+    def _index_handler(self, subscriber: "Subscriber", message_type: str) -> None:
+        """Index a subscriber as a listener of a message type. Listeners are kept in
+        subscription order, even if the handler is registered after the subscription.
+        Args:
+            subscriber: The subscriber handling the message type
+            message_type: The type of message
+        """
+        listeners, position = self._handlers[message_type], self._positions[id(subscriber)]
+        index = bisect_left(listeners, position, key=self._position)
+        if index == len(listeners) or listeners[index] is not subscriber:
+            listeners.insert(index, subscriber)
+
+    def _position(self, subscriber: "Subscriber") -> int:
+        """Return the position of a subscriber in the subscription order"""
+        return self._positions[id(subscriber)]
 
     def dispatch(self, sender, message_type: str, data: dict) -> None:
         """
-        Dispatch a message to all subscribers
+        Dispatch a message to all subscribers handling this type of message
 
         Args:
             sender: The sender of the message
             message_type: The type of message
             data: The data of the
         """
-        for subscriber in self._subscribers:
-            if subscriber != sender and message_type in subscriber.message_handlers:
+        for subscriber in self._handlers.get(message_type, ()):
+            if subscriber is not sender:
                 subscriber.message_handlers[message_type](data)
 
 
@@ -60,10 +83,13 @@ class Subscriber:
 
     def __init__(self):
         self.message_handlers = {}
+        self.env: Optional[Environment] = None
 
     def register_handler(self, message_type: str, callback):
         """Register a message handler"""
         self.message_handlers[message_type] = callback
+        if self.env is not None:
+            self.env._index_handler(self, message_type)
 
 
 environment = Environment()
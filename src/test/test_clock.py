@@ -1,7 +1,7 @@
 from shrimp import Clock, read_configuration
+from shrimp.environment import Environment
 import math
 
-
 CLOCK = Clock(120, grain=0.001, delay=0)
 CONFIGURATION = read_configuration()
 
@@ -54,3 +54,107 @@ def test_clock_remove_by_func():
     CLOCK.add(func=children_func, name="test")
     CLOCK.remove_by_func(children_func)
     assert "test" not in CLOCK.children.keys()
+
+
+def test_clock_executes_due_children_in_order():
+    """Due children should be executed once, in time order, using their latest schedule"""
+    played = []
+    CLOCK._beat = 0
+    CLOCK.add(func=lambda: played.append("late"), name="late", time=2, once=True)
+    CLOCK.add(func=lambda: played.append("early"), name="early", time=3, once=True)
+    CLOCK.add(func=lambda: played.append("early"), name="early", time=1, once=True)
+    CLOCK._beat = 2.5
+    CLOCK._execute_due_functions()
+    CLOCK._execute_due_functions()
+    CLOCK._beat = 0
+    assert played == ["early", "late"]
+    assert "early" not in CLOCK.children.keys()
+
+
+def test_clock_defers_children_scheduled_during_execution():
+    """A child rescheduling itself with no delay should only run once per clock iteration"""
+    played = []
+
+    def loop():
+        played.append("loop")
+        # Bounded so that the test fails instead of hanging if the clock does not defer the child
+        if played.count("loop") < 100:
+            CLOCK.add(
+                func=loop, name="loop", time=0, time_reference=CLOCK.children["loop"].next_time
+            )
+
+    CLOCK._beat = 0
+    CLOCK.add(func=loop, name="loop", time=1)
+    CLOCK.add(func=lambda: played.append("other"), name="other", time=1.5, once=True)
+    CLOCK._beat = 2
+    CLOCK._execute_due_functions()
+    assert sorted(played) == ["loop", "other"]
+    CLOCK._execute_due_functions()
+    assert played.count("loop") == 2
+    CLOCK.remove_by_name("loop")
+    CLOCK._beat = 0
+
+
+def test_clock_ignores_removed_children():
+    """A child removed then added again should only run with its new schedule"""
+    played = []
+    CLOCK._beat = 0
+    CLOCK.add(func=lambda: played.append("old"), name="readded", time=1, once=True)
+    CLOCK.remove_by_name("readded")
+    CLOCK.add(func=lambda: played.append("new"), name="readded", time=2, once=True)
+    CLOCK._beat = 1.5
+    CLOCK._execute_due_functions()
+    assert played == []
+    CLOCK._beat = 2.5
+    CLOCK._execute_due_functions()
+    CLOCK._beat = 0
+    assert played == ["new"]
+
+
+def test_clock_reschedule():
+    """A rescheduled child should only run at its new time"""
+    played = []
+    CLOCK._beat = 0
+    CLOCK.add(func=lambda: played.append(CLOCK._beat), name="moved", time=1)
+    CLOCK.reschedule("moved", 3)
+    CLOCK._beat = 2
+    CLOCK._execute_due_functions()
+    assert played == []
+    CLOCK._beat = 3
+    CLOCK._execute_due_functions()
+    CLOCK._execute_due_functions()
+    CLOCK.remove_by_name("moved")
+    CLOCK._beat = 0
+    assert played == [3]
+
+
+def test_clock_clear_drops_stale_entries():
+    """Clearing the clock or rebuilding its queue should drop outdated queue entries"""
+    played = []
+    CLOCK._beat = 0
+    CLOCK.add(func=lambda: played.append("moved"), name="moved", time=1)
+    for time in (2, 3, 4):
+        CLOCK.reschedule("moved", time)
+    CLOCK._rebuild_queue()
+    assert [name for _, _, name in CLOCK._queue].count("moved") == 1
+    CLOCK.clear()
+    assert all(name in CLOCK.children for _, _, name in CLOCK._queue)
+    CLOCK._beat = 5
+    CLOCK._execute_due_functions()
+    CLOCK._beat = 0
+    assert played == []
+
+
+def test_clock_plays_deferred_children_after_play():
+    """Children due while the clock is paused should run once the clock plays again"""
+    played, clock = [], Clock(120, grain=0.001, delay=0)
+    Environment().add_clock(clock)
+    clock._playing = False
+    clock.add(func=lambda: played.append("deferred"), name="deferred", time=1, once=True)
+    clock._beat = 2
+    clock._execute_due_functions()
+    assert played == []
+    clock.play()
+    clock._playing = True
+    clock._execute_due_functions()
+    assert played == ["deferred"]
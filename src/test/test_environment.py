@@ -0,0 +1,30 @@
+from shrimp.environment import Environment, Subscriber
+
+
+def _subscriber(calls: list, name: str) -> Subscriber:
+    subscriber = Subscriber()
+    subscriber.register_handler("ping", lambda data: calls.append(name))
+    return subscriber
+
+
+def test_dispatch_subscription_order():
+    """Handlers registered after the subscription should still be called in subscription order"""
+    env, calls = Environment(), []
+    first, second = Subscriber(), _subscriber(calls, "second")
+    env.subscribe(first)
+    env.subscribe(second)
+    first.register_handler("ping", lambda data: calls.append("first"))
+    env.dispatch(None, "ping", {})
+    assert calls == ["first", "second"]
+
+
+def test_dispatch_excludes_sender():
+    """The sender of a message should not receive its own message"""
+    env, calls = Environment(), []
+    first, second = _subscriber(calls, "first"), _subscriber(calls, "second")
+    env.subscribe(first)
+    env.subscribe(second)
+    env.dispatch(first, "ping", {})
+    assert calls == ["second"]
+    env.dispatch(second, "unknown", {})
+    assert calls == ["second"]
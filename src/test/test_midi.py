@@ -0,0 +1,79 @@
+from shrimp import Clock
+from shrimp.environment import Environment
+from shrimp.IO.midi import MIDIOut
+import threading
+import mido
+import time
+
+
+class _FakePort:
+    """Record the MIDI messages sent along with the Link time (in microseconds) of sending"""
+
+    def __init__(self, clock: Clock):
+        self.messages = []
+        self._micros = clock._link.clock().micros
+
+    def send(self, message: mido.Message) -> None:
+        self.messages.append((self._micros(), message))
+
+
+def _midi_out(latency: float):
+    env, clock = Environment(), Clock(120, grain=0.001, delay=0)
+    env.add_clock(clock)
+    midi = MIDIOut("test", clock)
+    midi._midi_out = port = _FakePort(clock)
+    midi.latency = latency
+    env.subscribe(midi)
+    clock._start()
+    return clock, midi, port
+
+
+def _send_from_clock(clock: Clock, midi: MIDIOut, message: mido.Message) -> float:
+    """Send a message from a clock event and return the deadline of that event"""
+    done, event_time = threading.Event(), []
+
+    def send():
+        midi._send(message)
+        event_time.append(clock.event_time)
+        done.set()
+
+    clock.add(func=send, name="send", time=clock.now, once=True, passthrough=True)
+    assert done.wait(1)
+    return event_time[0]
+
+
+def test_midi_latency():
+    """Messages sent from the clock should be held until the event deadline plus the latency"""
+    clock, midi, port = _midi_out(latency=0.05)
+    message = mido.Message("note_on", note=60)
+    event_time = _send_from_clock(clock, midi, message)
+    time.sleep(0.1)
+    clock._stop()
+    sent_at, sent = port.messages[0]
+    assert sent is message
+    assert event_time + 50_000 <= sent_at < event_time + 70_000
+
+
+def test_midi_all_notes_off_flushes_pending_messages():
+    """All notes off should send the pending note on messages first, without waiting for them"""
+    clock, midi, port = _midi_out(latency=0.5)
+    message = mido.Message("note_on", note=60)
+    _send_from_clock(clock, midi, message)
+    start = time.perf_counter()
+    midi.all_notes_off()
+    assert time.perf_counter() - start < 0.4
+    assert port.messages[0][1] is message
+    assert len(port.messages) == 1 + 16 * 128
+    assert all(sent.type == "note_off" for _, sent in port.messages[1:])
+    clock._stop()
+
+
+def test_midi_stop_drains_and_exits():
+    """Stopping should send the pending messages and terminate the output thread"""
+    clock, midi, port = _midi_out(latency=0.5)
+    message = mido.Message("note_on", note=60)
+    _send_from_clock(clock, midi, message)
+    clock._stop()
+    midi._output_loop_thread.join(1)
+    assert not midi._output_loop_thread.is_alive()
+    assert port.messages[0][1] is message
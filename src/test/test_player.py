@@ -0,0 +1,95 @@
+from shrimp import Clock
+from shrimp.environment import Environment
+from shrimp.Systems.PlayerSystem.PatternPlayer import Player
+from shrimp.Systems.PlayerSystem.Library.SequencePattern import Pseq
+import pytest
+
+PLAYER = Player(name="test", clock=Clock(120, grain=0.001, delay=0))
+
+
+def _lazy_players():
+    env = Environment()
+    clock = Clock(120, grain=0.001, delay=0)
+    env.add_clock(clock)
+    return env, Player.initialize_patterns(clock)
+
+
+def test_initialize_patterns_names():
+    """All player names should be visible before any player is instantiated"""
+    _, players = _lazy_players()
+    assert len(players) == 40
+    assert "p0" in players and "P19" in players
+    assert "p20" not in players
+    assert list(players)[:2] == ["p0", "p1"]
+    assert players.get("p20") is None
+
+
+def test_initialize_patterns_lazy_access():
+    """Looking up a player should always return the same instance, subscribed once"""
+    env, players = _lazy_players()
+    player = players.get("p3")
+    assert isinstance(player, Player) and player._name == "p3"
+    assert players["p3"] is player
+    assert dict(players.items())["p3"] is player
+    assert len(list(players.values())) == 40
+    assert env.subscribers.count(player) == 1
+    assert sum(isinstance(s, Player) for s in env.subscribers) == 40
+
+
+def _compiled(*args, **kwargs) -> list:
+    """Resolve a pattern over a few iterations using its compiled resolver"""
+    sender = Player._play_factory(print, *args, **kwargs)
+    resolver = PLAYER._compile_resolver(*PLAYER._resolution_plan(sender))
+    return [resolver(index) for index in range(4)]
+
+
+def _resolved(*args, **kwargs) -> list:
+    """Resolve a pattern over a few iterations using _resolve_value"""
+    return [
+        (
+            tuple(Player._resolve_value(arg, index) for arg in args),
+            {key: Player._resolve_value(value, index) for key, value in kwargs.items()},
+        )
+        for index in range(4)
+    ]
+
+
+def test_compile_resolver_no_arguments():
+    """A pattern without arguments should resolve to empty args and kwargs"""
+    assert _compiled() == [((), {})] * 4
+
+
+def test_compile_resolver_single_argument():
+    """A single argument should still resolve to a tuple"""
+    note = Pseq(60, 62, 64)
+    assert _compiled(note) == _resolved(note)
+    assert isinstance(_compiled(note)[0][0], tuple)
+
+
+def test_compile_resolver_keyword_arguments():
+    """Constant, pattern, callable and nested keyword arguments should match _resolve_value"""
+    kwargs = {
+        "dur": 1,
+        "note": Pseq(60, 62, 64),
+        "vel": lambda: 100,
+        "chord": [Pseq(1, 2), 3],
+        "params": {"cutoff": lambda: 200, "res": (Pseq(0.1, 0.2), 0.5)},
+    }
+    assert _compiled(Pseq(1, 2), **kwargs) == _resolved(Pseq(1, 2), **kwargs)
+
+
+def test_compile_resolver_non_identifier_keys():
+    """Keyword keys that are not valid identifiers should be preserved as is"""
+    kwargs = {"not an id": 1, "it's": Pseq(1, 2), "'}, 0, {'": lambda: 3}
+    assert _compiled(**kwargs) == _resolved(**kwargs)
+
+
+def test_resolve_value_depth_limit():
+    """A value that never resolves to a plain value should raise instead of looping forever"""
+
+    def itself():
+        return itself
+
+    with pytest.raises(ValueError):
+        Player._resolve_value(itself, 0)
+    assert Player._resolve_value(lambda: lambda: Pseq(1, 2), 1) == 2
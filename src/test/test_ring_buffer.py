@@ -0,0 +1,44 @@
+from shrimp.IO.midi import RingBuffer
+import pytest
+
+
+def test_ring_buffer_order():
+    """Items should be popped in the order they were pushed"""
+    buffer = RingBuffer(8)
+    for i in range(5):
+        assert buffer.push(i)
+    assert len(buffer) == 5
+    assert [buffer.pop() for _ in range(5)] == list(range(5))
+    assert buffer.pop() is None
+    assert len(buffer) == 0
+
+
+def test_ring_buffer_full():
+    """Pushing in a full buffer should fail without overwriting the oldest items"""
+    buffer = RingBuffer(4)
+    for i in range(4):
+        assert buffer.push(i)
+    assert not buffer.push(4)
+    assert len(buffer) == 4
+    assert buffer.pop() == 0
+    assert buffer.push(4)
+    assert [buffer.pop() for _ in range(4)] == [1, 2, 3, 4]
+
+
+def test_ring_buffer_wraparound():
+    """The buffer should keep its order when the indexes wrap around its size"""
+    buffer = RingBuffer(4)
+    popped = []
+    for i in range(0, 30, 3):
+        for j in range(i, i + 3):
+            assert buffer.push(j)
+        popped.extend(buffer.pop() for _ in range(3))
+    assert popped == list(range(30))
+    assert buffer.pop() is None
+
+
+@pytest.mark.parametrize("size", [0, 3, 1000, -4])
+def test_ring_buffer_rejects_invalid_size(size):
+    """The buffer size should be a positive power of two"""
+    with pytest.raises(ValueError):
+        RingBuffer(size)